@@ -6,40 +6,109 @@ This script duplicates a Bitwarden project with all its secrets.
 It prompts the user for the source project UUID and new project name.
 """
 
+import argparse
+import functools
+import json
 import logging
 import os
 import sys
-from typing import List, Optional
-from dotenv import load_dotenv
-from bitwarden_sdk import BitwardenClient, DeviceType, client_settings_from_dict
+import time
+import uuid
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Iterator, List, Optional, Tuple
+from tqdm import tqdm
+from tqdm.contrib.logging import logging_redirect_tqdm
+
+# Maximum number of secret IDs requested per get_by_ids call
+SECRETS_BATCH_SIZE = 20
+
+# The .env file next to this script, loaded if present
+_DOTENV_PATH = Path(__file__).resolve().with_name(".env")
+
+# Directory holding the encrypted per-project secret caches
+CACHE_DIR = Path.home() / ".cache" / "bw_duplicator"
+
+# Environment variables read by the duplicator
+_CONFIG_KEYS = ("ORGANIZATION_ID", "ACCESS_TOKEN", "STATE_FILE", "API_URL", "IDENTITY_URL", "ENVIRONMENT_TEMPLATES")
+
+# Environment templates used when ENVIRONMENT_TEMPLATES is not set
+_DEFAULT_TEMPLATES = MappingProxyType({
+    "dev": {"prefix": "dev", "description": "Development environment"},
+    "staging": {"prefix": "staging", "description": "Staging/QA environment"},
+    "prod": {"prefix": "prod", "description": "Production environment"},
+    "test": {"prefix": "test", "description": "Testing environment"},
+    "qa": {"prefix": "qa", "description": "Quality Assurance environment"},
+    "uat": {"prefix": "uat", "description": "User Acceptance Testing environment"}
+})
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_templates(env_templates: str) -> MappingProxyType:
+    """Parse comma-separated environment:prefix:description templates."""
+    templates = {}
+    for template in env_templates.split(","):
+        parts = template.strip().split(":")
+        if len(parts) >= 2:
+            env_name = parts[0].strip()
+            prefix = parts[1].strip()
+            description = parts[2].strip() if len(parts) > 2 else f"{env_name.title()} environment"
+            templates[env_name] = {"prefix": prefix, "description": description}
+        elif len(parts) == 1:
+            # Just environment name, use default prefix
+            env_name = parts[0].strip()
+            templates[env_name] = {"prefix": env_name, "description": f"{env_name.title()} environment"}
+    return MappingProxyType(templates)
+
+
+def _normalize_project_id(project_id: str) -> str:
+    """Return the canonical lowercase form of a project UUID."""
+    return str(uuid.UUID(project_id))
+
+
+def _matches_project(secret_detail, project_id: str) -> bool:
+    """Check whether a secret belongs to the project with the given (string) ID."""
+    # Full secrets carry a single project_id, identifiers a project_ids list; both hold UUIDs
+    secret_project_id = getattr(secret_detail, 'project_id', None)
+    if secret_project_id is not None:
+        return str(secret_project_id) == project_id
+    project_ids = getattr(secret_detail, 'project_ids', None)
+    return bool(project_ids) and project_id in map(str, project_ids)
+
 
 class BitwardenProjectDuplicator:
-    def __init__(self):
+    __slots__ = (
+        'organization_id', 'access_token', 'state_path', 'api_url', 'identity_url',
+        'logger', 'environment_templates', 'refresh_cache', 'write_cache',
+        '_client', '_secrets_api', '_secrets_cache'
+    )
+
+    def __init__(self, refresh_cache: bool = False, write_cache: bool = False):
         """Initialize the Bitwarden client and load environment variables."""
         # Load environment variables from .env file
-        load_dotenv()
+        if _DOTENV_PATH.exists():
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path=_DOTENV_PATH, override=False)
+        
+        # Read all configuration in one pass
+        config = {key: os.environ.get(key) for key in _CONFIG_KEYS}
         
         # Validate required environment variables
-        self.organization_id = os.getenv("ORGANIZATION_ID")
-        self.access_token = os.getenv("ACCESS_TOKEN")
-        self.state_path = os.getenv("STATE_FILE", "./bw_state")
+        self.organization_id = config["ORGANIZATION_ID"]
+        self.access_token = config["ACCESS_TOKEN"]
+        self.state_path = config["STATE_FILE"] or "./bw_state"
+        self.api_url = config["API_URL"] or "https://api.bitwarden.com"
+        self.identity_url = config["IDENTITY_URL"] or "https://identity.bitwarden.com"
         
         if not self.organization_id:
             raise ValueError("ORGANIZATION_ID environment variable is required")
         if not self.access_token:
             raise ValueError("ACCESS_TOKEN environment variable is required")
         
-        # Create the BitwardenClient
-        self.client = BitwardenClient(
-            client_settings_from_dict(
-                {
-                    "apiUrl": os.getenv("API_URL", "https://api.bitwarden.com"),
-                    "deviceType": DeviceType.SDK,
-                    "identityUrl": os.getenv("IDENTITY_URL", "https://identity.bitwarden.com"),
-                    "userAgent": "Python Project Duplicator",
-                }
-            )
-        )
+        # The BitwardenClient and its secrets API are created on first use,
+        # see the client and secrets_api properties
+        self._client = None
+        self._secrets_api = None
         
         # Set up logging
         logging.basicConfig(
@@ -49,29 +118,50 @@ class BitwardenProjectDuplicator:
         self.logger = logging.getLogger(__name__)
         
         # Load environment templates from .env or use defaults
-        self.environment_templates = self._load_environment_templates()
+        self.environment_templates = self._load_environment_templates(config["ENVIRONMENT_TEMPLATES"])
+        
+        # Source project secrets already fetched during this session, keyed by project ID
+        self._secrets_cache: Dict[str, List] = {}
+        
+        # Invalidate secrets cached on disk by previous runs
+        self.refresh_cache = refresh_cache
+        
+        # Write fetched secrets to the on-disk cache, only when explicitly requested
+        self.write_cache = write_cache
 
-    def _load_environment_templates(self) -> dict:
+    @property
+    def client(self):
+        """Return the BitwardenClient, importing the SDK and creating it on first access."""
+        if self._client is None:
+            from bitwarden_sdk import BitwardenClient, DeviceType, client_settings_from_dict
+            
+            # Its native HTTP client keeps a connection pool, so this single
+            # instance is shared by every call.
+            self._client = BitwardenClient(
+                client_settings_from_dict(
+                    {
+                        "apiUrl": self.api_url,
+                        "deviceType": DeviceType.SDK,
+                        "identityUrl": self.identity_url,
+                        "userAgent": "Python Project Duplicator",
+                    }
+                )
+            )
+        return self._client
+
+    @property
+    def secrets_api(self):
+        """Return the SDK secrets client, created once instead of on every call."""
+        if self._secrets_api is None:
+            self._secrets_api = self.client.secrets()
+        return self._secrets_api
+
+    def _load_environment_templates(self, env_templates: Optional[str]) -> MappingProxyType:
         """Load environment templates from .env file or return defaults."""
-        templates = {}
-        
         # Try to load from environment variables
-        env_templates = os.getenv("ENVIRONMENT_TEMPLATES")
         if env_templates:
             try:
-                # Parse comma-separated environment:prefix:description format
-                for template in env_templates.split(","):
-                    parts = template.strip().split(":")
-                    if len(parts) >= 2:
-                        env_name = parts[0].strip()
-                        prefix = parts[1].strip()
-                        description = parts[2].strip() if len(parts) > 2 else f"{env_name.title()} environment"
-                        templates[env_name] = {"prefix": prefix, "description": description}
-                    elif len(parts) == 1:
-                        # Just environment name, use default prefix
-                        env_name = parts[0].strip()
-                        templates[env_name] = {"prefix": env_name, "description": f"{env_name.title()} environment"}
-                
+                templates = _parse_env_templates(env_templates)
                 if templates:
                     self.logger.info(f"Loaded {len(templates)} environment templates from .env")
                     return templates
@@ -79,22 +169,17 @@ class BitwardenProjectDuplicator:
                 self.logger.warning(f"Failed to parse ENVIRONMENT_TEMPLATES from .env: {e}")
         
         # Fallback to default templates
-        default_templates = {
-            "dev": {"prefix": "dev", "description": "Development environment"},
-            "staging": {"prefix": "staging", "description": "Staging/QA environment"},
-            "prod": {"prefix": "prod", "description": "Production environment"},
-            "test": {"prefix": "test", "description": "Testing environment"},
-            "qa": {"prefix": "qa", "description": "Quality Assurance environment"},
-            "uat": {"prefix": "uat", "description": "User Acceptance Testing environment"}
-        }
-        
         self.logger.info("Using default environment templates")
-        return default_templates
+        return _DEFAULT_TEMPLATES
 
     def authenticate(self) -> bool:
         """Authenticate with Bitwarden using the access token."""
+        # Resolved outside the try so a missing SDK is not reported as a login failure
+        client = self.client
         try:
-            self.client.auth().login_access_token(self.access_token, self.state_path)
+            # The SDK resumes an unexpired session saved in the state file without
+            # contacting the identity server, and only logs in again when it has to
+            client.auth().login_access_token(self.access_token, self.state_path)
             self.logger.info("Successfully authenticated with Bitwarden")
             return True
         except Exception as e:
@@ -116,29 +201,172 @@ class BitwardenProjectDuplicator:
 
     def get_project_secrets(self, project_id: str) -> List[dict]:
         """Retrieve all secrets associated with a project."""
+        if project_id in self._secrets_cache:
+            return self._secrets_cache[project_id]
+        
+        # Secrets report their projects as lowercase UUID strings
+        try:
+            pid = _normalize_project_id(project_id)
+        except ValueError:
+            pid = str(project_id)
+        
         try:
-            all_secrets_response = self.client.secrets().list(self.organization_id)
+            # A single sync call returns every secret with its values and project
+            secret_details = self._sync_secret_details()
+            complete = True
             
-            if not all_secrets_response.success:
-                self.logger.error(f"Failed to retrieve secrets: {all_secrets_response.error_message}")
-                return []
+            if secret_details is None:
+                all_secrets_response = self.secrets_api.list(self.organization_id)
+                
+                if not all_secrets_response.success:
+                    self.logger.error(f"Failed to retrieve secrets: {all_secrets_response.error_message}")
+                    return []
+                
+                secret_identifiers = all_secrets_response.data.data
+                if not secret_identifiers:
+                    return []
+                
+                # Identifiers carry no value or note, so the full secrets are always fetched,
+                # but only for this project when the SDK reports project membership
+                if hasattr(secret_identifiers[0], 'project_ids'):
+                    secret_ids = [secret.id for secret in secret_identifiers if _matches_project(secret, pid)]
+                else:
+                    secret_ids = [secret.id for secret in secret_identifiers]
+                if not secret_ids:
+                    return []
+                
+                secret_details, complete = self._fetch_secret_details(secret_ids)
             
             # Filter secrets that belong to the specified project
-            project_secrets = []
-            for secret in all_secrets_response.data.data:
-                secret_detail_response = self.client.secrets().get(secret.id)
-                if secret_detail_response.success:
-                    secret_detail = secret_detail_response.data
-                    if hasattr(secret_detail, 'project_ids') and project_id in secret_detail.project_ids:
-                        project_secrets.append(secret_detail)
-                    elif hasattr(secret_detail, 'project_id') and str(secret_detail.project_id) == str(project_id):
-                        project_secrets.append(secret_detail)
-                
+            project_secrets = [secret_detail for secret_detail in secret_details if _matches_project(secret_detail, pid)]
+            
+            # Only cache complete, non-empty results so failures are retried next time
+            if complete and project_secrets:
+                self._secrets_cache[project_id] = project_secrets
+                if self.write_cache:
+                    self.save_cached_secrets(project_id, project_secrets)
             return project_secrets
         except Exception as e:
             self.logger.error(f"Error retrieving secrets for project {project_id}: {e}")
             return []
 
+    def _cache_path(self, project_id: str) -> Path:
+        """Return the on-disk cache file for a project's secrets."""
+        # Normalising through UUID keeps arbitrary input out of the file name
+        return CACHE_DIR / f"{_normalize_project_id(project_id)}.enc"
+
+    def _cache_cipher(self):
+        """Return an AES-GCM cipher keyed by HKDF over the access token."""
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+        
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"bw_duplicator secrets cache",
+        ).derive(self.access_token.encode())
+        return AESGCM(key)
+
+    def get_cached_secrets_time(self, project_id: str) -> Optional[float]:
+        """Return when a project's secrets were cached on disk, or None if there is no usable cache."""
+        if self.refresh_cache:
+            return None
+        try:
+            return self._cache_path(project_id).stat().st_mtime
+        except (OSError, ValueError):
+            return None
+
+    def save_cached_secrets(self, project_id: str, secrets: List[dict]):
+        """Encrypt a project's secrets and write them to the on-disk cache."""
+        try:
+            # The file's modification time records when it was cached
+            payload = json.dumps({
+                "secrets": [
+                    {"id": str(secret.id), "key": secret.key, "value": secret.value, "note": secret.note}
+                    for secret in secrets
+                ]
+            }).encode()
+            nonce = os.urandom(12)
+            encrypted = self._cache_cipher().encrypt(nonce, payload, _normalize_project_id(project_id).encode())
+            
+            # Create the directory and file private from the start, never world-readable
+            CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(self._cache_path(project_id), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as cache_file:
+                os.fchmod(cache_file.fileno(), 0o600)
+                cache_file.write(nonce + encrypted)
+        except Exception as e:
+            self.logger.warning(f"Failed to cache secrets for project {project_id}: {e}")
+
+    def invalidate_cached_secrets(self, project_id: str):
+        """Delete a project's on-disk secrets cache, if there is one."""
+        try:
+            self._cache_path(project_id).unlink()
+            self.logger.info(f"Removed cached secrets for project {project_id}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Failed to remove cached secrets for project {project_id}: {e}")
+
+    def load_cached_secrets(self, project_id: str) -> bool:
+        """Load a project's secrets from the on-disk cache into the session cache."""
+        try:
+            data = self._cache_path(project_id).read_bytes()
+            payload = self._cache_cipher().decrypt(data[:12], data[12:], _normalize_project_id(project_id).encode())
+            secrets = [SimpleNamespace(**secret) for secret in json.loads(payload)["secrets"]]
+        except Exception as e:
+            # Decryption errors such as InvalidTag carry no message
+            self.logger.warning(f"Failed to load cached secrets for project {project_id}: {str(e) or type(e).__name__}")
+            return False
+        
+        self._secrets_cache[project_id] = secrets
+        self.logger.info(f"Loaded {len(secrets)} cached secrets for project {project_id}")
+        return True
+
+    def _sync_secret_details(self) -> Optional[List[dict]]:
+        """Fetch all secrets in one sync call, or return None if the SDK cannot sync."""
+        secrets_api = self.secrets_api
+        if not hasattr(secrets_api, 'sync'):
+            return None
+        
+        try:
+            # Without a last synced date the response always contains every secret
+            sync_response = secrets_api.sync(self.organization_id, None)
+            if sync_response.success:
+                return sync_response.data.secrets or []
+            self.logger.warning(f"Failed to sync secrets, falling back to listing: {sync_response.error_message}")
+        except Exception as e:
+            self.logger.warning(f"Failed to sync secrets, falling back to listing: {e}")
+        return None
+
+    def _fetch_secret_details(self, secret_ids: List[str]) -> Tuple[List[dict], bool]:
+        """Fetch full secret details in batches, returning them with whether every request succeeded."""
+        secrets_api = self.secrets_api
+        secret_details = []
+        complete = True
+        
+        if hasattr(secrets_api, 'get_by_ids'):
+            for start in range(0, len(secret_ids), SECRETS_BATCH_SIZE):
+                batch_response = secrets_api.get_by_ids(secret_ids[start:start + SECRETS_BATCH_SIZE])
+                if batch_response.success:
+                    secret_details.extend(batch_response.data.data)
+                else:
+                    self.logger.error(f"Failed to retrieve secret details: {batch_response.error_message}")
+                    complete = False
+            return secret_details, complete
+        
+        # No batch getter available: fetch the secrets one by one
+        for secret_id in secret_ids:
+            response = secrets_api.get(secret_id)
+            if response.success:
+                secret_details.append(response.data)
+            else:
+                self.logger.error(f"Failed to retrieve secret {secret_id}: {response.error_message}")
+                complete = False
+        return secret_details, complete
+
     def create_project(self, project_name: str) -> Optional[dict]:
         """Create a new project."""
         try:
@@ -153,29 +381,32 @@ class BitwardenProjectDuplicator:
             self.logger.error(f"Error creating project {project_name}: {e}")
             return None
 
-    def duplicate_secret(self, secret: dict, new_project_id: str, secret_prefix: str = None) -> bool:
-        """Duplicate a secret to the new project."""
+    def _create_secret(self, payload: dict, new_project_id: str) -> bool:
+        """Create a secret from a payload with key, value and note in the given project."""
         try:
-            # Apply prefix to secret key if provided
-            new_secret_key = f"{secret_prefix}_{secret.key}" if secret_prefix else secret.key
-            
-            response = self.client.secrets().create(
+            response = self.secrets_api.create(
                 self.organization_id,
-                new_secret_key,
-                secret.value,
-                secret.note,
+                payload["key"],
+                payload["value"],
+                payload["note"],
                 [new_project_id]
             )
             
             if response.success:
                 return True
             else:
-                self.logger.error(f"Failed to duplicate secret {secret.key}: {response.error_message}")
+                self.logger.error(f"Failed to create secret {payload['key']}: {response.error_message}")
                 return False
         except Exception as e:
-            self.logger.error(f"Error duplicating secret {secret.key}: {e}")
+            self.logger.error(f"Error creating secret {payload['key']}: {e}")
             return False
 
+    def create_secrets(self, payload_list: List[dict], new_project_id: str) -> Iterator[bool]:
+        """Create secrets one request per secret, yielding whether each one succeeded."""
+        create_secret = self._create_secret
+        for payload in payload_list:
+            yield create_secret(payload, new_project_id)
+
     def duplicate_project(self, source_project_id: str, new_project_name: str, secret_prefix: str = None) -> bool:
         """Duplicate a project with all its secrets."""
         self.logger.info(f"Starting duplication of project {source_project_id}")
@@ -203,14 +434,22 @@ class BitwardenProjectDuplicator:
         
         if total_secrets > 0:
             print(f"\n🔄 Duplicating {total_secrets} secrets...")
-            for i, secret in enumerate(secrets, 1):
-                new_key = f"{secret_prefix}_{secret.key}" if secret_prefix else secret.key
-                print(f"   [{i}/{total_secrets}] Duplicating '{secret.key}' → '{new_key}'...", end=" ")
-                if self.duplicate_secret(secret, new_project.id, secret_prefix):
-                    success_count += 1
-                    print("✅")
-                else:
-                    print("❌")
+            # Resolve the prefix once rather than per secret
+            key_prefix = f"{secret_prefix}_" if secret_prefix else ""
+            payloads = [
+                {
+                    "key": key_prefix + secret.key,
+                    "value": secret.value,
+                    "note": secret.note
+                }
+                for secret in secrets
+            ]
+            results = self.create_secrets(payloads, new_project.id)
+            # Route failure logs through tqdm so they don't break the progress bar
+            with logging_redirect_tqdm():
+                for success in tqdm(results, total=total_secrets, desc="   Duplicating", unit="secret"):
+                    if success:
+                        success_count += 1
         else:
             print("\nℹ️  No secrets to duplicate")
         
@@ -239,6 +478,16 @@ class BitwardenProjectDuplicator:
             self.logger.warning("No secrets found in source project")
             return False
         
+        # Build the prefixed payloads for every known environment up front
+        payloads_by_env = {}
+        for env in environments:
+            if env in self.environment_templates:
+                key_prefix = f"{self.environment_templates[env]['prefix']}_"
+                payloads_by_env[env] = [
+                    {"key": key_prefix + secret.key, "value": secret.value, "note": secret.note}
+                    for secret in secrets
+                ]
+        
         # Create environments
         created_projects = []
         total_environments = len(environments)
@@ -269,14 +518,12 @@ class BitwardenProjectDuplicator:
             total_secrets = len(secrets)
             
             print(f"      🔄 Duplicating {total_secrets} secrets...")
-            for j, secret in enumerate(secrets, 1):
-                new_key = f"{prefix}_{secret.key}"
-                print(f"         [{j}/{total_secrets}] '{secret.key}' → '{new_key}'...", end=" ")
-                if self.duplicate_secret(secret, new_project.id, prefix):
-                    success_count += 1
-                    print("✅")
-                else:
-                    print("❌")
+            payloads = payloads_by_env[env]
+            results = self.create_secrets(payloads, new_project.id)
+            with logging_redirect_tqdm():
+                for success in tqdm(results, total=total_secrets, desc="         Duplicating", unit="secret"):
+                    if success:
+                        success_count += 1
             
             created_projects.append({
                 "environment": env,
@@ -310,11 +557,6 @@ class BitwardenProjectDuplicator:
         """Main execution method."""
         print("=== Bitwarden Project Duplicator ===\n")
         
-        # Authenticate
-        if not self.authenticate():
-            print("❌ Authentication failed. Please check your ACCESS_TOKEN in the .env file.")
-            sys.exit(1)
-        
         # Show menu options
         while True:
             print("\nOptions:")
@@ -326,9 +568,11 @@ class BitwardenProjectDuplicator:
             choice = input("\nSelect an option (1-4): ").strip()
             
             if choice == "1":
+                self._require_authentication()
                 self._duplicate_single_project()
                 break
             elif choice == "2":
+                self._require_authentication()
                 self._create_environment_templates()
                 break
             elif choice == "3":
@@ -339,6 +583,27 @@ class BitwardenProjectDuplicator:
             else:
                 print("Invalid choice. Please select 1-4.")
 
+    def _require_authentication(self):
+        """Authenticate before an option that talks to Bitwarden, exiting on failure."""
+        if not self.authenticate():
+            print("❌ Authentication failed. Please check your ACCESS_TOKEN in the .env file.")
+            sys.exit(1)
+
+    def _offer_cached_secrets(self, project_id: str):
+        """Ask whether to reuse secrets cached on disk by a previous run."""
+        if self.refresh_cache:
+            self.invalidate_cached_secrets(project_id)
+            return
+        
+        cached_at = self.get_cached_secrets_time(project_id)
+        if cached_at is None:
+            return
+        
+        cached_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cached_at))
+        reuse = input(f"Reuse secrets cached on {cached_time}? (y/N): ").strip().lower()
+        if reuse in ['y', 'yes']:
+            self.load_cached_secrets(project_id)
+
     def _duplicate_single_project(self):
         """Handle single project duplication."""
         # Get source project UUID
@@ -348,6 +613,9 @@ class BitwardenProjectDuplicator:
                 break
             print("Project UUID cannot be empty. Please try again.")
         
+        # Offer secrets cached by a previous run
+        self._offer_cached_secrets(source_project_id)
+        
         # Get new project name
         while True:
             new_project_name = input("Enter the new project name: ").strip()
@@ -395,6 +663,9 @@ class BitwardenProjectDuplicator:
                 break
             print("Project UUID cannot be empty. Please try again.")
         
+        # Offer secrets cached by a previous run
+        self._offer_cached_secrets(source_project_id)
+        
         # Get base project name
         while True:
             base_project_name = input("Enter the base project name (e.g., 'backend' for 'backend-dev', 'backend-staging'): ").strip()
@@ -459,8 +730,21 @@ class BitwardenProjectDuplicator:
 
 def main():
     """Entry point for the script."""
+    parser = argparse.ArgumentParser(description="Duplicate a Bitwarden Secrets Manager project with all its secrets.")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="delete secrets cached by previous runs and fetch them from Bitwarden"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="save fetched secrets, encrypted, to the on-disk cache for later runs"
+    )
+    args = parser.parse_args()
+    
     try:
-        duplicator = BitwardenProjectDuplicator()
+        duplicator = BitwardenProjectDuplicator(refresh_cache=args.refresh, write_cache=args.cache)
         duplicator.run()
     except ValueError as e:
         print(f"❌ Configuration error: {e}")
@@ -469,6 +753,10 @@ def main():
         print("  - ACCESS_TOKEN=your_access_token")
         print("  - STATE_FILE=./bw_state (optional)")
         sys.exit(1)
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        print("\nPlease install the requirements with: pip install -r requirements.txt")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Unexpected error during initialization: {e}")
         sys.exit(1)